@@ -6,19 +6,21 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import FinanzguruApi, FinanzguruAuthError, FinanzguruError, FinanzguruTokens
+from .api import FinanzguruApi, FinanzguruTokens
 from .const import (
     CONF_ACCESS_TOKEN,
+    CONF_DEDICATED_SESSION,
     CONF_REFRESH_TOKEN,
     CONF_TOKEN_EXPIRES_AT,
+    DEFAULT_DEDICATED_SESSION,
     DOMAIN,
-    UPDATE_INTERVAL,
 )
+from .coordinator import FinanzguruDataUpdateCoordinator
+from .forecast import SpendingHistory
 from .frontend import async_register_frontend
+from .services import async_setup_services, async_unload_services
+from .session import async_close_finanzguru_session, async_get_finanzguru_session
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -42,7 +44,10 @@ def _tokens_from_entry(entry: ConfigEntry) -> tuple[str | None, str | None, date
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
-    session = async_get_clientsession(hass)
+    session = async_get_finanzguru_session(
+        hass,
+        entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION),
+    )
     await async_register_frontend(hass)
 
     async def _async_update_tokens(tokens: FinanzguruTokens) -> None:
@@ -65,45 +70,47 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         token_updater=_async_update_tokens,
     )
 
-    async def _async_update_data() -> dict:
-        try:
-            overview = await api.async_get_overview()
-            accounts = overview.get("accounts") or {}
-            budgets = overview.get("budgets") or {}
-            contracts = overview.get("contracts") or {}
-
-            return {
-                "monthly": api.extract_monthly_expenses_income(accounts),
-                "today_spending": api.extract_today_spending(accounts),
-                "contracts": api.extract_contracts(contracts),
-                "budgets": api.extract_budget_status(budgets),
-            }
-        except FinanzguruAuthError as err:
-            raise ConfigEntryAuthFailed(str(err)) from err
-        except FinanzguruError as err:
-            raise UpdateFailed(str(err)) from err
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="Finanzguru",
-        update_interval=UPDATE_INTERVAL,
-        update_method=_async_update_data,
-    )
+    history = SpendingHistory(hass, entry.entry_id)
+    await history.async_load()
+
+    coordinator = FinanzguruDataUpdateCoordinator(hass, entry, api, history)
+    entry.async_on_unload(coordinator.async_cancel_pending)
 
     await coordinator.async_config_entry_first_refresh()
 
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
+        "history": history,
+        "options": dict(entry.options),
     }
 
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+    async_setup_services(hass)
+
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    # Der Listener feuert bei jedem async_update_entry, also auch bei jedem Token-Refresh.
+    # Neu geladen wird nur, wenn sich die Optionen gegenüber dem Setup geändert haben.
+    loaded = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if loaded is not None and loaded.get("options") == dict(entry.options):
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        await hass.data[DOMAIN][entry.entry_id]["history"].async_flush()
         hass.data[DOMAIN].pop(entry.entry_id, None)
+        if not hass.data[DOMAIN]:
+            async_unload_services(hass)
+            await async_close_finanzguru_session(hass)
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    await SpendingHistory(hass, entry.entry_id).async_remove()
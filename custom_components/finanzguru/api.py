@@ -3,10 +3,30 @@ from __future__ import annotations
 import asyncio
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Awaitable, Callable
+from typing import Any, Awaitable, Callable, Iterable
 
 import aiohttp
 
+from .const import (
+    API_HOST,
+    REQUEST_TIMEOUT_CONNECT,
+    REQUEST_TIMEOUT_SOCK_READ,
+    REQUEST_TIMEOUT_TOTAL,
+    SECTION_ACCOUNTS,
+    SECTION_BUDGETS,
+    SECTION_CONTRACTS,
+    SECTIONS,
+)
+
+# Timeouts pro Phase statt eines einzigen Gesamt-Timeouts: ein hängender Verbindungsaufbau
+# fällt früh auf, langsame Antworten dürfen trotzdem vollständig gelesen werden.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(
+    total=REQUEST_TIMEOUT_TOTAL,
+    connect=REQUEST_TIMEOUT_CONNECT,
+    sock_connect=REQUEST_TIMEOUT_CONNECT,
+    sock_read=REQUEST_TIMEOUT_SOCK_READ,
+)
+
 
 class FinanzguruError(Exception):
     pass
@@ -35,7 +55,7 @@ class FinanzguruApi:
         refresh_token: str | None = None,
         expires_at: datetime | None = None,
         token_updater: TokenUpdater | None = None,
-        base_url: str = "https://api1.finanzguru.de",
+        base_url: str = f"https://{API_HOST}",
         request_timeout: aiohttp.ClientTimeout | None = None,
     ) -> None:
         self._session = session
@@ -44,7 +64,7 @@ class FinanzguruApi:
         self._expires_at = expires_at
         self._token_updater = token_updater
         self._base_url = base_url.rstrip("/")
-        self._timeout = request_timeout or aiohttp.ClientTimeout(total=30)
+        self._timeout = request_timeout or REQUEST_TIMEOUT
         self._token_lock = asyncio.Lock()
 
     @property
@@ -126,16 +146,18 @@ class FinanzguruApi:
         return await self._async_request("GET", "/contracts")
 
     async def async_get_overview(self) -> dict[str, Any]:
-        accounts, budgets, contracts = await asyncio.gather(
-            self.async_get_bank_accounts(),
-            self.async_get_budgets(),
-            self.async_get_contracts(),
-        )
-        return {
-            "accounts": accounts,
-            "budgets": budgets,
-            "contracts": contracts,
+        return await self.async_get_sections(SECTIONS)
+
+    async def async_get_sections(self, sections: Iterable[str]) -> dict[str, Any]:
+        fetchers: dict[str, Callable[[], Awaitable[dict[str, Any]]]] = {
+            SECTION_ACCOUNTS: self.async_get_bank_accounts,
+            SECTION_BUDGETS: self.async_get_budgets,
+            SECTION_CONTRACTS: self.async_get_contracts,
         }
+        requested = set(sections)
+        selected = [section for section in SECTIONS if section in requested]
+        results = await asyncio.gather(*(fetchers[section]() for section in selected))
+        return dict(zip(selected, results))
 
     def extract_monthly_expenses_income(self, accounts_payload: dict[str, Any]) -> dict[str, Any]:
         monthly = (
@@ -163,6 +185,22 @@ class FinanzguruApi:
             return items
         return []
 
+    def extract_transactions_by_account(
+        self, accounts_payload: dict[str, Any]
+    ) -> dict[str | None, list[dict[str, Any]]]:
+        transactions = accounts_payload.get("transactions")
+        if isinstance(transactions, list):
+            return {None: transactions}
+
+        grouped: dict[str | None, list[dict[str, Any]]] = {}
+        accounts = accounts_payload.get("accounts") or accounts_payload.get("items") or []
+        if isinstance(accounts, list):
+            for position, account in enumerate(accounts):
+                if isinstance(account, dict) and isinstance(account.get("transactions"), list):
+                    account_id = account.get("id") or account.get("iban") or position
+                    grouped.setdefault(str(account_id), []).extend(account["transactions"])
+        return grouped
+
     def extract_budget_status(self, budgets_payload: dict[str, Any]) -> dict[str, Any]:
         current = budgets_payload.get("current") or budgets_payload.get("budget") or {}
         return current if isinstance(current, dict) else {}
@@ -5,16 +5,19 @@ import logging
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import callback
 
 from .api import FinanzguruApi, FinanzguruAuthError, FinanzguruError
 from .const import (
     CONF_ACCESS_TOKEN,
+    CONF_DEDICATED_SESSION,
     CONF_EMAIL,
     CONF_REFRESH_TOKEN,
     CONF_TOKEN_EXPIRES_AT,
+    DEFAULT_DEDICATED_SESSION,
     DOMAIN,
 )
+from .session import async_get_finanzguru_session
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,6 +25,13 @@ _LOGGER = logging.getLogger(__name__)
 class FinanzguruConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> FinanzguruOptionsFlow:
+        return FinanzguruOptionsFlow()
+
     async def async_step_user(self, user_input: dict | None = None):
         errors: dict[str, str] = {}
 
@@ -32,7 +42,7 @@ class FinanzguruConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if access_token is not None:
                 access_token = access_token.strip() or None
 
-            session = async_get_clientsession(self.hass)
+            session = async_get_finanzguru_session(self.hass)
             api = FinanzguruApi(
                 session,
                 access_token=access_token,
@@ -88,7 +98,12 @@ class FinanzguruConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if access_token is not None:
                 access_token = access_token.strip() or None
 
-            session = async_get_clientsession(self.hass)
+            session = async_get_finanzguru_session(
+                self.hass,
+                self._reauth_entry.options.get(
+                    CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION
+                ),
+            )
             api = FinanzguruApi(
                 session,
                 access_token=access_token,
@@ -132,3 +147,21 @@ class FinanzguruConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=schema,
             errors=errors,
         )
+
+
+class FinanzguruOptionsFlow(config_entries.OptionsFlow):
+    async def async_step_init(self, user_input: dict | None = None):
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_DEDICATED_SESSION,
+                    default=self.config_entry.options.get(
+                        CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION
+                    ),
+                ): bool,
+            }
+        )
+        return self.async_show_form(step_id="init", data_schema=schema)
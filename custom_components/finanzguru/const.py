@@ -12,9 +12,54 @@ CONF_PASSWORD = "password"
 CONF_ACCESS_TOKEN = "access_token"
 CONF_REFRESH_TOKEN = "refresh_token"
 CONF_TOKEN_EXPIRES_AT = "token_expires_at"
+CONF_DEDICATED_SESSION = "dedicated_session"
+
+DEFAULT_DEDICATED_SESSION = True
 
 UPDATE_INTERVAL = timedelta(minutes=30)
 
+SECTION_ACCOUNTS = "accounts"
+SECTION_BUDGETS = "budgets"
+SECTION_CONTRACTS = "contracts"
+SECTIONS: Final[tuple[str, ...]] = (SECTION_ACCOUNTS, SECTION_BUDGETS, SECTION_CONTRACTS)
+
+SERVICE_REFRESH = "refresh"
+SERVICE_SEARCH_TRANSACTIONS = "search_transactions"
+ATTR_SECTIONS = "sections"
+ATTR_ENTRY_ID = "entry_id"
+ATTR_TEXT = "text"
+ATTR_MIN_AMOUNT = "min_amount"
+ATTR_MAX_AMOUNT = "max_amount"
+ATTR_START_DATE = "start_date"
+ATTR_END_DATE = "end_date"
+ATTR_CATEGORY = "category"
+ATTR_PAGE = "page"
+ATTR_PAGE_SIZE = "page_size"
+
+SEARCH_DEFAULT_PAGE_SIZE: Final[int] = 50
+SEARCH_MAX_PAGE_SIZE: Final[int] = 500
+
+# Aufrufe innerhalb dieses Fensters werden zu einer Anfrage pro Endpunkt zusammengefasst.
+REFRESH_DEBOUNCE: Final[float] = 2.0
+# Mindestabstand zwischen zwei Abrufen desselben Endpunkts, um das Backend zu schonen.
+REFRESH_MIN_INTERVAL: Final[float] = 60.0
+
+API_HOST: Final[str] = "api1.finanzguru.de"
+DATA_SESSION: Final[str] = f"{DOMAIN}_session"
+
+REQUEST_TIMEOUT_TOTAL: Final[float] = 30.0
+REQUEST_TIMEOUT_CONNECT: Final[float] = 10.0
+REQUEST_TIMEOUT_SOCK_READ: Final[float] = 20.0
+
+SESSION_LIMIT_PER_HOST: Final[int] = 4
+SESSION_DNS_CACHE_TTL: Final[int] = 300
+SESSION_KEEPALIVE_TIMEOUT: Final[float] = 60.0
+
+FORECAST_HISTORY_DAYS: Final[int] = 91
+FORECAST_MIN_SAMPLES: Final[int] = 7
+FORECAST_SAVE_DELAY: Final[int] = 60
+FORECAST_STORAGE_VERSION: Final[int] = 1
+
 _MANIFEST_PATH = Path(__file__).parent / "manifest.json"
 INTEGRATION_VERSION: Final[str] = json.loads(_MANIFEST_PATH.read_text(encoding="utf-8")).get(
     "version",
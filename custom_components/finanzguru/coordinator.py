@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import FinanzguruApi, FinanzguruAuthError, FinanzguruError
+from .const import (
+    REFRESH_DEBOUNCE,
+    REFRESH_MIN_INTERVAL,
+    SECTION_ACCOUNTS,
+    SECTION_BUDGETS,
+    SECTION_CONTRACTS,
+    SECTIONS,
+    UPDATE_INTERVAL,
+)
+from .forecast import SpendingHistory
+from .transactions import TransactionIndex
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class FinanzguruDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        api: FinanzguruApi,
+        history: SpendingHistory,
+    ) -> None:
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Finanzguru",
+            update_interval=UPDATE_INTERVAL,
+        )
+        self.entry = entry
+        self.api = api
+        self.history = history
+        self.transactions = TransactionIndex()
+        self._payloads: dict[str, dict[str, Any]] = {}
+        self._last_fetch: dict[str, float] = {}
+        self._pending: dict[str, asyncio.Future[None]] = {}
+        self._pending_at: float | None = None
+        self._unsub_pending: CALLBACK_TYPE | None = None
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        try:
+            self._store_payloads(await self.api.async_get_overview())
+        except FinanzguruAuthError as err:
+            raise ConfigEntryAuthFailed(str(err)) from err
+        except FinanzguruError as err:
+            raise UpdateFailed(str(err)) from err
+        return self._build_data()
+
+    async def async_request_sections(self, sections: Iterable[str] | None = None) -> None:
+        # Gezielter Abruf einzelner Endpunkte. Jeder Bereich hat einen eigenen Future, auf den
+        # alle Aufrufer warten; Anfragen innerhalb von REFRESH_DEBOUNCE laufen im selben Abruf.
+        now = time.monotonic()
+        futures: list[asyncio.Future[None]] = []
+        due = math.inf
+        for section in set(sections or SECTIONS):
+            future = self._pending.get(section)
+            if future is None:
+                future = self._pending[section] = self.hass.loop.create_future()
+                due = min(due, max(now + REFRESH_DEBOUNCE, self._ready_at(section)))
+            futures.append(future)
+
+        if due < math.inf and (self._pending_at is None or due < self._pending_at):
+            self._schedule_pending(due - now)
+
+        if not futures:
+            return
+
+        # asyncio.wait bricht die geteilten Futures beim Abbruch eines Aufrufers nicht ab.
+        # Danach wird jede Exception abgeholt, damit asyncio keine davon als ungelesen meldet.
+        await asyncio.wait(futures)
+        cancelled = False
+        errors: list[BaseException] = []
+        for future in futures:
+            if future.cancelled():
+                cancelled = True
+            elif (error := future.exception()) is not None:
+                errors.append(error)
+        if cancelled:
+            raise asyncio.CancelledError
+        if errors:
+            raise errors[0]
+
+    @callback
+    def async_cancel_pending(self) -> None:
+        if self._unsub_pending:
+            self._unsub_pending()
+            self._unsub_pending = None
+        self._pending_at = None
+        for future in self._pending.values():
+            if not future.done():
+                future.cancel()
+        self._pending.clear()
+
+    def _ready_at(self, section: str) -> float:
+        return self._last_fetch.get(section, -math.inf) + REFRESH_MIN_INTERVAL
+
+    @callback
+    def _schedule_pending(self, delay: float) -> None:
+        if self._unsub_pending:
+            self._unsub_pending()
+        self._pending_at = time.monotonic() + delay
+        self._unsub_pending = async_call_later(self.hass, delay, self._async_fetch_pending)
+
+    async def _async_fetch_pending(self, _now: Any = None) -> None:
+        self._unsub_pending = None
+        self._pending_at = None
+
+        # Nur Bereiche abrufen, deren Mindestabstand abgelaufen ist; die übrigen warten
+        # auf ihren eigenen Termin statt den ganzen Abruf aufzuhalten.
+        now = time.monotonic()
+        ready = {
+            section: future
+            for section, future in self._pending.items()
+            if self._ready_at(section) <= now
+        }
+        for section in ready:
+            del self._pending[section]
+            self._last_fetch[section] = now
+        if self._pending:
+            next_at = min(self._ready_at(section) for section in self._pending)
+            self._schedule_pending(max(next_at - now, 0.0))
+        if not ready:
+            return
+
+        try:
+            payloads = await self.api.async_get_sections(ready)
+        except FinanzguruAuthError as err:
+            self.entry.async_start_reauth(self.hass)
+            _set_exception(ready.values(), err)
+            return
+        except Exception as err:  # noqa: BLE001
+            _set_exception(ready.values(), err)
+            return
+
+        self._store_payloads(payloads)
+        # Nicht async_set_updated_data: das würde den regulären Vollabruf jedes Mal neu
+        # terminieren, und häufige Teilabrufe würden Budgets und Verträge nie aktualisieren.
+        self.data = self._build_data()
+        self.async_update_listeners()
+        for future in ready.values():
+            if not future.done():
+                future.set_result(None)
+
+    @callback
+    def _store_payloads(self, payloads: dict[str, Any]) -> None:
+        now = time.monotonic()
+        for section, payload in payloads.items():
+            self._payloads[section] = payload if isinstance(payload, dict) else {}
+            self._last_fetch[section] = now
+
+        # Die Tagesreihe nur mit frisch abgerufenen Kontodaten füttern, nicht mit dem Cache.
+        accounts = payloads.get(SECTION_ACCOUNTS)
+        if isinstance(accounts, dict):
+            self.history.async_add_observation(
+                dt_util.now().date(),
+                self.api.extract_today_spending(accounts),
+                self.api.extract_monthly_expenses_income(accounts).get("expenses"),
+            )
+            self.transactions.update(self.api.extract_transactions_by_account(accounts))
+
+    @callback
+    def _build_data(self) -> dict[str, Any]:
+        accounts = self._payloads.get(SECTION_ACCOUNTS) or {}
+        budgets = self._payloads.get(SECTION_BUDGETS) or {}
+        contracts = self._payloads.get(SECTION_CONTRACTS) or {}
+
+        monthly = self.api.extract_monthly_expenses_income(accounts)
+        today_spending = self.api.extract_today_spending(accounts)
+        budget = self.api.extract_budget_status(budgets)
+
+        return {
+            "monthly": monthly,
+            "today_spending": today_spending,
+            "contracts": self.api.extract_contracts(contracts),
+            "budgets": budget,
+            "forecast": self.history.forecast(
+                dt_util.now().date(),
+                month_to_date=monthly.get("expenses"),
+                budget_spent=budget.get("spent"),
+                budget_limit=budget.get("limit"),
+            ),
+        }
+
+
+def _set_exception(futures: Iterable[asyncio.Future[None]], err: Exception) -> None:
+    for future in futures:
+        if not future.done():
+            future.set_exception(err)
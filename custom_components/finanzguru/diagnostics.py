@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CONF_ACCESS_TOKEN,
+    CONF_DEDICATED_SESSION,
+    CONF_EMAIL,
+    CONF_REFRESH_TOKEN,
+    DEFAULT_DEDICATED_SESSION,
+    DOMAIN,
+)
+from .session import async_get_session_stats
+
+TO_REDACT = {CONF_ACCESS_TOKEN, CONF_REFRESH_TOKEN, CONF_EMAIL}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    dedicated = entry.options.get(CONF_DEDICATED_SESSION, DEFAULT_DEDICATED_SESSION)
+    # Bei fehlgeschlagenem oder erneut versuchtem Setup gibt es keinen Coordinator; Session-
+    # und Optionsdaten sind gerade dann hilfreich und werden trotzdem ausgegeben.
+    loaded = hass.data.get(DOMAIN, {}).get(entry.entry_id) or {}
+    coordinator = loaded.get("coordinator")
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "coordinator": (
+            {
+                "last_update_success": coordinator.last_update_success,
+                "update_interval": str(coordinator.update_interval),
+            }
+            if coordinator is not None
+            else None
+        ),
+        "session": {
+            "dedicated": dedicated,
+            "stats": async_get_session_stats(hass) if dedicated else None,
+        },
+    }
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from array import array
+import calendar
+from dataclasses import dataclass
+from datetime import date, timedelta
+import math
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    FORECAST_HISTORY_DAYS,
+    FORECAST_MIN_SAMPLES,
+    FORECAST_SAVE_DELAY,
+    FORECAST_STORAGE_VERSION,
+)
+
+
+@dataclass(frozen=True)
+class SpendingForecast:
+    month_end_expenses: float
+    month_to_date: float
+    daily_trend: float
+    samples: int
+    budget_limit: float | None
+    budget_exceeded_on: date | None
+
+
+def _as_float(value: Any) -> float | None:
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+class SpendingHistory:
+    # Rollierende Tagesreihe der Ausgaben in einem Ringpuffer fester Größe. Index ist das
+    # Datums-Ordinal modulo Puffergröße, fehlende Tage sind NaN. Dadurch bleiben Speicher
+    # und Rechenaufwand der Prognose konstant, egal wie lange die Integration schon läuft.
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        size: int = FORECAST_HISTORY_DAYS,
+    ) -> None:
+        self._store: Store[dict[str, Any]] = Store(
+            hass, FORECAST_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.spending_history"
+        )
+        self._size = size
+        self._values = array("d", [math.nan]) * size
+        self._last_day: int | None = None
+        self._version = 0
+        self._dirty = False
+        self._cache_key: tuple[Any, ...] | None = None
+        self._cache: SpendingForecast | None = None
+
+    async def async_load(self) -> None:
+        data = await self._store.async_load()
+        if not isinstance(data, dict):
+            return
+
+        last_day = data.get("last_day")
+        values = data.get("values")
+        if not isinstance(last_day, int) or not isinstance(values, list):
+            return
+
+        values = values[-self._size :]
+        first_day = last_day - len(values) + 1
+        for offset, value in enumerate(values):
+            if isinstance(value, (int, float)):
+                self._values[(first_day + offset) % self._size] = float(value)
+        self._last_day = last_day
+        self._version += 1
+
+    async def async_flush(self) -> None:
+        # Ausstehendes async_delay_save sofort schreiben (und damit abbrechen), damit nach
+        # dem Entladen kein verzögerter Schreibvorgang die Datei erneut anlegt.
+        if not self._dirty:
+            return
+        await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        await self._store.async_remove()
+
+    @callback
+    def async_add_observation(
+        self,
+        day: date,
+        today_spending: Any,
+        month_to_date: Any,
+    ) -> bool:
+        spent = _as_float(today_spending)
+        if spent is not None:
+            spent = abs(spent)
+        else:
+            # Ohne Tageswert: aus der Monatssumme abzüglich der bekannten Vortage ableiten.
+            # Die Reihe speichert Beträge, daher die Monatssumme vorher ebenfalls normalisieren.
+            total = _as_float(month_to_date)
+            if total is None or not self._month_complete_before(day):
+                return False
+            spent = abs(total) - self._month_sum(day, include_day=False)
+        return self._set(day, max(spent, 0.0))
+
+    def forecast(
+        self,
+        day: date,
+        month_to_date: Any = None,
+        budget_spent: Any = None,
+        budget_limit: Any = None,
+    ) -> SpendingForecast | None:
+        key = (self._version, day.toordinal(), month_to_date, budget_spent, budget_limit)
+        if key == self._cache_key:
+            return self._cache
+
+        self._cache_key = key
+        self._cache = self._compute(
+            day,
+            _as_float(month_to_date),
+            _as_float(budget_spent),
+            _as_float(budget_limit),
+        )
+        return self._cache
+
+    def _set(self, day: date, value: float) -> bool:
+        ordinal = day.toordinal()
+        if self._last_day is None:
+            self._last_day = ordinal
+        elif ordinal > self._last_day:
+            for step in range(1, min(ordinal - self._last_day, self._size) + 1):
+                self._values[(self._last_day + step) % self._size] = math.nan
+            self._last_day = ordinal
+        elif ordinal <= self._last_day - self._size:
+            return False
+
+        index = ordinal % self._size
+        if self._values[index] == value:
+            return False
+
+        self._values[index] = value
+        self._version += 1
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, FORECAST_SAVE_DELAY)
+        return True
+
+    def _get(self, ordinal: int) -> float:
+        if self._last_day is None or not self._last_day - self._size < ordinal <= self._last_day:
+            return math.nan
+        return self._values[ordinal % self._size]
+
+    def _month_sum(self, day: date, *, include_day: bool) -> float:
+        end = day.day if include_day else day.day - 1
+        first = day.replace(day=1).toordinal()
+        return math.fsum(
+            value
+            for value in (self._get(first + offset) for offset in range(end))
+            if not math.isnan(value)
+        )
+
+    def _month_complete_before(self, day: date) -> bool:
+        first = day.replace(day=1).toordinal()
+        return all(
+            not math.isnan(self._get(ordinal)) for ordinal in range(first, day.toordinal())
+        )
+
+    def _compute(
+        self,
+        day: date,
+        month_to_date: float | None,
+        budget_spent: float | None,
+        budget_limit: float | None,
+    ) -> SpendingForecast | None:
+        if self._last_day is None:
+            return None
+
+        today = day.toordinal()
+        points: list[tuple[int, float]] = []
+        for ordinal in range(self._last_day - self._size + 1, self._last_day + 1):
+            value = self._values[ordinal % self._size]
+            if not math.isnan(value) and ordinal <= today:
+                points.append((ordinal - today, value))
+
+        n = len(points)
+        if n < FORECAST_MIN_SAMPLES:
+            return None
+
+        # Linearer Trend per geschlossener Kleinste-Quadrate-Lösung über die Summen.
+        sum_x = sum_y = sum_xx = sum_xy = 0.0
+        for x, y in points:
+            sum_x += x
+            sum_y += y
+            sum_xx += x * x
+            sum_xy += x * y
+        denominator = n * sum_xx - sum_x * sum_x
+        slope = (n * sum_xy - sum_x * sum_y) / denominator if denominator else 0.0
+        intercept = (sum_y - slope * sum_x) / n
+
+        # Wochentags-Saisonalität: mittleres Residuum je Wochentag.
+        residual_sums = [0.0] * 7
+        residual_counts = [0] * 7
+        for x, y in points:
+            weekday = (day.weekday() + x) % 7
+            residual_sums[weekday] += y - (intercept + slope * x)
+            residual_counts[weekday] += 1
+        seasonality = [
+            total / count if count else 0.0
+            for total, count in zip(residual_sums, residual_counts)
+        ]
+
+        days_in_month = calendar.monthrange(day.year, day.month)[1]
+        predictions = [
+            max(intercept + slope * x + seasonality[(day.weekday() + x) % 7], 0.0)
+            for x in range(1, days_in_month - day.day + 1)
+        ]
+
+        if month_to_date is None:
+            month_to_date = self._month_sum(day, include_day=True)
+        month_to_date = abs(month_to_date)
+
+        return SpendingForecast(
+            month_end_expenses=round(month_to_date + math.fsum(predictions), 2),
+            month_to_date=round(month_to_date, 2),
+            daily_trend=round(slope, 4),
+            samples=n,
+            budget_limit=budget_limit,
+            budget_exceeded_on=self._budget_exceeded_on(
+                day, predictions, month_to_date, budget_spent, budget_limit
+            ),
+        )
+
+    def _budget_exceeded_on(
+        self,
+        day: date,
+        predictions: list[float],
+        month_to_date: float,
+        budget_spent: float | None,
+        budget_limit: float | None,
+    ) -> date | None:
+        if not budget_limit or budget_limit <= 0:
+            return None
+
+        spent = abs(budget_spent) if budget_spent is not None else month_to_date
+
+        # Deckt das Budget nur einen Teil der Ausgaben ab, wird die Reihe anteilig skaliert.
+        share = 1.0
+        if budget_spent is not None and month_to_date > 0:
+            share = min(spent / month_to_date, 1.0)
+
+        if spent > budget_limit:
+            # Bereits überschritten: den Tag im laufenden Monat suchen, an dem die kumulierten
+            # Ausgaben das Budget erstmals überschritten haben, statt jeden Tag "heute" zu melden.
+            cumulative = 0.0
+            first = day.replace(day=1)
+            for offset in range(day.day):
+                value = self._get(first.toordinal() + offset)
+                if math.isnan(value):
+                    continue
+                cumulative += value * share
+                if cumulative > budget_limit:
+                    return first + timedelta(days=offset)
+            return day
+
+        for offset, predicted in enumerate(predictions, start=1):
+            spent += predicted * share
+            if spent > budget_limit:
+                return day + timedelta(days=offset)
+        return None
+
+    def _data_to_save(self) -> dict[str, Any]:
+        self._dirty = False
+        if self._last_day is None:
+            return {"last_day": None, "values": []}
+        values = [
+            None if math.isnan(value) else value
+            for value in (
+                self._values[ordinal % self._size]
+                for ordinal in range(self._last_day - self._size + 1, self._last_day + 1)
+            )
+        ]
+        return {"last_day": self._last_day, "values": values}
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+from datetime import date
 from typing import Any
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .forecast import SpendingForecast
 
 
 async def async_setup_entry(
@@ -26,6 +28,8 @@ async def async_setup_entry(
             FinanzguruTodaySpendingSensor(coordinator, entry, currency),
             FinanzguruContractsOverviewSensor(coordinator, entry, currency),
             FinanzguruBudgetUsageSensor(coordinator, entry),
+            FinanzguruMonthEndForecastSensor(coordinator, entry, currency),
+            FinanzguruBudgetExceededDateSensor(coordinator, entry),
         ],
         update_before_add=False,
     )
@@ -159,3 +163,59 @@ class FinanzguruBudgetUsageSensor(FinanzguruBaseSensor):
             return float(spent) / float(limit_) * 100.0
 
         return None
+
+
+class FinanzguruForecastBaseSensor(FinanzguruBaseSensor):
+    @property
+    def _forecast(self) -> SpendingForecast | None:
+        forecast = (self.coordinator.data or {}).get("forecast")
+        return forecast if isinstance(forecast, SpendingForecast) else None
+
+
+class FinanzguruMonthEndForecastSensor(FinanzguruForecastBaseSensor):
+    _attr_name = "Prognose Monatsausgaben"
+
+    def __init__(self, coordinator, entry: ConfigEntry, currency: str) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_month_end_forecast"
+        self._attr_native_unit_of_measurement = currency
+
+    @property
+    def native_value(self) -> float | None:
+        forecast = self._forecast
+        return forecast.month_end_expenses if forecast else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        forecast = self._forecast
+        if forecast is None:
+            return {}
+        return {
+            "bisher": forecast.month_to_date,
+            "trend_pro_tag": forecast.daily_trend,
+            "datenpunkte": forecast.samples,
+        }
+
+
+class FinanzguruBudgetExceededDateSensor(FinanzguruForecastBaseSensor):
+    _attr_name = "Budget überschritten am"
+    _attr_device_class = SensorDeviceClass.DATE
+
+    def __init__(self, coordinator, entry: ConfigEntry) -> None:
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_budget_exceeded_date"
+
+    @property
+    def native_value(self) -> date | None:
+        forecast = self._forecast
+        return forecast.budget_exceeded_on if forecast else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        forecast = self._forecast
+        if forecast is None or forecast.budget_limit is None:
+            return {}
+        return {
+            "budget": forecast.budget_limit,
+            "prognose_monatsende": forecast.month_end_expenses,
+        }
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import asyncio
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .api import FinanzguruError
+from .const import (
+    ATTR_CATEGORY,
+    ATTR_END_DATE,
+    ATTR_ENTRY_ID,
+    ATTR_MAX_AMOUNT,
+    ATTR_MIN_AMOUNT,
+    ATTR_PAGE,
+    ATTR_PAGE_SIZE,
+    ATTR_SECTIONS,
+    ATTR_START_DATE,
+    ATTR_TEXT,
+    DOMAIN,
+    SEARCH_DEFAULT_PAGE_SIZE,
+    SEARCH_MAX_PAGE_SIZE,
+    SECTIONS,
+    SERVICE_REFRESH,
+    SERVICE_SEARCH_TRANSACTIONS,
+)
+from .coordinator import FinanzguruDataUpdateCoordinator
+from .transactions import search_transactions
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_SECTIONS): vol.All(cv.ensure_list, [vol.In(SECTIONS)]),
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+SEARCH_TRANSACTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_TEXT): cv.string,
+        vol.Optional(ATTR_MIN_AMOUNT): vol.Coerce(float),
+        vol.Optional(ATTR_MAX_AMOUNT): vol.Coerce(float),
+        vol.Optional(ATTR_START_DATE): cv.date,
+        vol.Optional(ATTR_END_DATE): cv.date,
+        vol.Optional(ATTR_CATEGORY): cv.string,
+        vol.Optional(ATTR_PAGE, default=1): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(ATTR_PAGE_SIZE, default=SEARCH_DEFAULT_PAGE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=SEARCH_MAX_PAGE_SIZE)
+        ),
+        vol.Optional(ATTR_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
+
+def _coordinators_for_call(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[FinanzguruDataUpdateCoordinator]:
+    loaded: dict[str, dict] = hass.data.get(DOMAIN, {})
+    entry_ids: list[str] = call.data.get(ATTR_ENTRY_ID) or list(loaded)
+
+    coordinators: list[FinanzguruDataUpdateCoordinator] = []
+    for entry_id in entry_ids:
+        if entry_id not in loaded:
+            raise HomeAssistantError(f"Finanzguru entry {entry_id} is not loaded")
+        coordinators.append(loaded[entry_id]["coordinator"])
+    return coordinators
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH):
+        return
+
+    async def _async_refresh(call: ServiceCall) -> None:
+        sections: list[str] = call.data.get(ATTR_SECTIONS) or list(SECTIONS)
+        coordinators = _coordinators_for_call(hass, call)
+        results = await asyncio.gather(
+            *(coordinator.async_request_sections(sections) for coordinator in coordinators),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, asyncio.CancelledError):
+                # Der Eintrag wurde entladen oder neu geladen, bevor der Abruf lief.
+                raise HomeAssistantError("Finanzguru refresh aborted: entry unloaded")
+            if isinstance(result, FinanzguruError):
+                raise HomeAssistantError(f"Finanzguru refresh failed: {result}") from result
+            if isinstance(result, Exception):
+                raise result
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        _async_refresh,
+        schema=REFRESH_SCHEMA,
+    )
+
+    async def _async_search_transactions(call: ServiceCall) -> ServiceResponse:
+        coordinators = _coordinators_for_call(hass, call)
+        page: int = call.data[ATTR_PAGE]
+        page_size: int = call.data[ATTR_PAGE_SIZE]
+        result = search_transactions(
+            (coordinator.transactions for coordinator in coordinators),
+            page=page,
+            page_size=page_size,
+            text=call.data.get(ATTR_TEXT),
+            min_amount=call.data.get(ATTR_MIN_AMOUNT),
+            max_amount=call.data.get(ATTR_MAX_AMOUNT),
+            start=call.data.get(ATTR_START_DATE),
+            end=call.data.get(ATTR_END_DATE),
+            category=call.data.get(ATTR_CATEGORY),
+        )
+        return {
+            "total": result.total,
+            "page": page,
+            "page_size": page_size,
+            "sum": result.sum,
+            "income": result.income,
+            "expenses": result.expenses,
+            "transactions": [transaction.as_dict() for transaction in result.items],
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEARCH_TRANSACTIONS,
+        _async_search_transactions,
+        schema=SEARCH_TRANSACTIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
+@callback
+def async_unload_services(hass: HomeAssistant) -> None:
+    hass.services.async_remove(DOMAIN, SERVICE_REFRESH)
+    hass.services.async_remove(DOMAIN, SERVICE_SEARCH_TRANSACTIONS)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from importlib.util import find_spec
+import logging
+from types import SimpleNamespace
+from typing import Any
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import SERVER_SOFTWARE, async_get_clientsession
+from homeassistant.util.ssl import client_context
+
+from .api import REQUEST_TIMEOUT
+from .const import (
+    DATA_SESSION,
+    SESSION_DNS_CACHE_TTL,
+    SESSION_KEEPALIVE_TIMEOUT,
+    SESSION_LIMIT_PER_HOST,
+)
+
+# aiohttp dekodiert Brotli nur, wenn eines der beiden Pakete installiert ist.
+_ACCEPT_ENCODING = (
+    "gzip, br" if any(find_spec(name) for name in ("brotli", "brotlicffi")) else "gzip"
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class FinanzguruSessionStats:
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = asdict(self)
+        data["reuse_ratio"] = (
+            round(self.connections_reused / self.requests, 3) if self.requests else None
+        )
+        return data
+
+
+@dataclass
+class FinanzguruSession:
+    session: aiohttp.ClientSession
+    stats: FinanzguruSessionStats = field(default_factory=FinanzguruSessionStats)
+    unsub_close: CALLBACK_TYPE | None = None
+
+
+def _trace_config(stats: FinanzguruSessionStats) -> aiohttp.TraceConfig:
+    # Verbindungs-Wiederverwendung zählen, damit Keep-Alive in den Diagnosedaten sichtbar wird.
+    async def _on_request_start(
+        _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.requests += 1
+
+    async def _on_connection_create_end(
+        _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.connections_created += 1
+
+    async def _on_connection_reuseconn(
+        _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.connections_reused += 1
+
+    async def _on_dns_cache_hit(
+        _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.dns_cache_hits += 1
+
+    async def _on_dns_cache_miss(
+        _session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: Any
+    ) -> None:
+        stats.dns_cache_misses += 1
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_dns_cache_hit.append(_on_dns_cache_hit)
+    trace_config.on_dns_cache_miss.append(_on_dns_cache_miss)
+    return trace_config
+
+
+@callback
+def _async_create_session(hass: HomeAssistant) -> FinanzguruSession:
+    stats = FinanzguruSessionStats()
+    connector = aiohttp.TCPConnector(
+        limit_per_host=SESSION_LIMIT_PER_HOST,
+        ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+        keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+        ssl=client_context(),
+    )
+    session = aiohttp.ClientSession(
+        connector=connector,
+        headers={
+            aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE,
+            aiohttp.hdrs.ACCEPT_ENCODING: _ACCEPT_ENCODING,
+        },
+        timeout=REQUEST_TIMEOUT,
+        trace_configs=[_trace_config(stats)],
+    )
+    holder = FinanzguruSession(session=session, stats=stats)
+
+    async def _async_close_on_stop(_event: Event) -> None:
+        holder.unsub_close = None
+        await session.close()
+
+    holder.unsub_close = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close_on_stop
+    )
+    return holder
+
+
+@callback
+def async_get_finanzguru_session(
+    hass: HomeAssistant, dedicated: bool = True
+) -> aiohttp.ClientSession:
+    # Eigene Session pro Domain: Verbindungslimits, DNS-Cache und Timeouts sind so
+    # unabhängig von allen anderen Integrationen, die die geteilte HA-Session nutzen.
+    if not dedicated:
+        return async_get_clientsession(hass)
+
+    holder: FinanzguruSession | None = hass.data.get(DATA_SESSION)
+    if holder is None or holder.session.closed:
+        holder = _async_create_session(hass)
+        hass.data[DATA_SESSION] = holder
+        _LOGGER.debug("Created dedicated Finanzguru HTTP session")
+    return holder.session
+
+
+@callback
+def async_get_session_stats(hass: HomeAssistant) -> dict[str, Any] | None:
+    holder: FinanzguruSession | None = hass.data.get(DATA_SESSION)
+    if holder is None or holder.session.closed:
+        return None
+    return holder.stats.as_dict()
+
+
+async def async_close_finanzguru_session(hass: HomeAssistant) -> None:
+    holder: FinanzguruSession | None = hass.data.pop(DATA_SESSION, None)
+    if holder is None:
+        return
+    if holder.unsub_close:
+        holder.unsub_close()
+        holder.unsub_close = None
+    await holder.session.close()
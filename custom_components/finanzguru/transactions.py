@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from dataclasses import dataclass
+from datetime import date
+import heapq
+import math
+import re
+from typing import Any, Iterable, Iterator, Mapping
+
+_TOKEN_RE = re.compile(r"\w+")
+_BULK_THRESHOLD = 64
+
+_ID_KEYS = ("id", "transaction_id", "transactionId")
+_DATE_KEYS = ("date", "booking_date", "bookingDate", "value_date", "valueDate")
+_MERCHANT_KEYS = ("merchant", "counterparty", "counterparty_name", "payee", "name")
+_DESCRIPTION_KEYS = ("description", "purpose", "reference", "title")
+
+
+@dataclass(frozen=True)
+class IndexedTransaction:
+    id: str
+    day: date | None
+    amount: float
+    merchant: str | None
+    description: str | None
+    category: str | None
+    account: str | None = None
+
+    @property
+    def ordinal(self) -> int:
+        return self.day.toordinal() if self.day else 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "date": self.day.isoformat() if self.day else None,
+            "amount": self.amount,
+            "merchant": self.merchant,
+            "description": self.description,
+            "category": self.category,
+            "account": self.account,
+        }
+
+
+@dataclass(frozen=True)
+class TransactionSearchResult:
+    total: int
+    sum: float
+    income: float
+    expenses: float
+    items: list[IndexedTransaction]
+
+
+def _first_str(item: dict[str, Any], keys: Iterable[str]) -> str | None:
+    for key in keys:
+        value = item.get(key)
+        if isinstance(value, dict):
+            value = value.get("name")
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
+
+def _parse_day(value: str | None) -> date | None:
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def _normalize(
+    item: Any, account: str | None, occurrences: dict[str, int]
+) -> IndexedTransaction | None:
+    if not isinstance(item, dict):
+        return None
+
+    amount = item.get("amount")
+    if isinstance(amount, dict):
+        amount = amount.get("value")
+    if not isinstance(amount, (int, float)) or isinstance(amount, bool):
+        return None
+
+    day = _parse_day(_first_str(item, _DATE_KEYS))
+    merchant = _first_str(item, _MERCHANT_KEYS)
+    description = _first_str(item, _DESCRIPTION_KEYS)
+    category = _first_str(item, ("category",))
+
+    transaction_id = next(
+        (str(item[key]) for key in _ID_KEYS if item.get(key) not in (None, "")),
+        None,
+    )
+    if transaction_id is None:
+        # Ohne ID einen stabilen Schlüssel aus den Buchungsdaten bilden. Identische Buchungen
+        # am selben Tag (z. B. zweimal derselbe Kaffee) werden pro Abruf durchnummeriert.
+        key = f"{account}|{day}|{amount}|{merchant}|{description}"
+        occurrence = occurrences.get(key, 0)
+        occurrences[key] = occurrence + 1
+        transaction_id = f"{key}#{occurrence}"
+
+    return IndexedTransaction(
+        id=transaction_id,
+        day=day,
+        amount=float(amount),
+        merchant=merchant,
+        description=description,
+        category=category,
+        account=account,
+    )
+
+
+def _tokens(transaction: IndexedTransaction) -> set[str]:
+    text = f"{transaction.merchant or ''} {transaction.description or ''}"
+    return set(_TOKEN_RE.findall(text.casefold()))
+
+
+class TransactionIndex:
+    # Lokaler Suchindex über die synchronisierten Umsätze: Token-Index für Händler und
+    # Verwendungszweck (mit sortiertem Vokabular für Präfixsuche) sowie nach Datum sortierte
+    # Listen gesamt und pro Kategorie. Updates ändern nur neue oder geänderte Umsätze.
+
+    def __init__(self) -> None:
+        self._by_id: dict[str, IndexedTransaction] = {}
+        self._tokens: dict[str, set[str]] = {}
+        self._vocabulary: list[str] = []
+        self._by_date: list[tuple[int, str]] = []
+        self._by_category: dict[str, list[tuple[int, str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def update(self, items_by_account: Mapping[str | None, Iterable[Any]]) -> int:
+        # Die Kontodaten sind ein Schnappschuss je Konto: Umsätze eines Kontos, die in dessen
+        # geliefertem Zeitraum fehlen (z. B. vorgemerkte Buchungen mit neuer ID), fliegen raus.
+        # Der Zeitraum gilt pro Konto, weil Konten unterschiedlich weit zurückreichen können.
+        occurrences: dict[str, int] = {}
+        present: dict[str | None, dict[str, int]] = {}
+        changed: dict[str, IndexedTransaction] = {}
+        for account, items in items_by_account.items():
+            seen = present.setdefault(account, {})
+            for item in items:
+                transaction = _normalize(item, account, occurrences)
+                if transaction is None:
+                    continue
+                seen[transaction.id] = transaction.ordinal
+                existing = self._by_id.get(transaction.id)
+                if existing == transaction:
+                    continue
+                if existing is not None:
+                    self._remove(existing)
+                changed[transaction.id] = transaction
+
+        removed = sum(
+            self._remove_missing(account, seen) for account, seen in present.items()
+        )
+
+        # Große Schübe (z. B. die erste Synchronisierung) anhängen und einmal sortieren,
+        # statt jeden Umsatz einzeln einzusortieren.
+        bulk = len(changed) > _BULK_THRESHOLD
+        for transaction in changed.values():
+            self._add(transaction, keep_sorted=not bulk)
+        if bulk:
+            self._by_date.sort()
+            for bucket in self._by_category.values():
+                bucket.sort()
+            self._vocabulary = sorted(self._tokens)
+        return len(changed) + removed
+
+    def _remove_missing(self, account: str | None, seen: dict[str, int]) -> int:
+        if not seen:
+            return 0
+
+        dated = [ordinal for ordinal in seen.values() if ordinal]
+        ranges: list[tuple[int, int]] = []
+        if dated:
+            ranges.append((min(dated), max(dated)))
+        if len(dated) < len(seen):
+            ranges.append((0, 0))
+
+        stale: list[IndexedTransaction] = []
+        for low_ordinal, high_ordinal in ranges:
+            low = bisect_left(self._by_date, (low_ordinal, ""))
+            high = bisect_left(self._by_date, (high_ordinal + 1, ""))
+            stale.extend(
+                transaction
+                for transaction in (self._by_id[tid] for _, tid in self._by_date[low:high])
+                if transaction.account == account and transaction.id not in seen
+            )
+        for transaction in stale:
+            self._remove(transaction)
+        return len(stale)
+
+    def iter_matches(
+        self,
+        *,
+        text: str | None = None,
+        min_amount: float | None = None,
+        max_amount: float | None = None,
+        start: date | None = None,
+        end: date | None = None,
+        category: str | None = None,
+    ) -> Iterator[IndexedTransaction]:
+        sequence = (
+            self._by_category.get(category.casefold(), [])
+            if category is not None
+            else self._by_date
+        )
+        low = bisect_left(sequence, (start.toordinal(), "")) if start else 0
+        high = bisect_left(sequence, (end.toordinal() + 1, "")) if end else len(sequence)
+
+        text_ids = self._match_text(text) if text and text.strip() else None
+        if text_ids is not None and len(text_ids) < high - low:
+            # Wenige Texttreffer: direkt über diese statt über den Datumsbereich iterieren.
+            keys = sorted(
+                (
+                    key
+                    for key in ((self._by_id[tid].ordinal, tid) for tid in text_ids)
+                    if (not start or key >= (start.toordinal(), ""))
+                    and (not end or key < (end.toordinal() + 1, ""))
+                ),
+                reverse=True,
+            )
+            candidates: Iterable[str] = (tid for _, tid in keys)
+            check_category = category is not None
+            text_ids = None
+        else:
+            candidates = (sequence[index][1] for index in range(high - 1, low - 1, -1))
+            check_category = False
+
+        folded_category = category.casefold() if category is not None else None
+        for transaction_id in candidates:
+            if text_ids is not None and transaction_id not in text_ids:
+                continue
+            transaction = self._by_id[transaction_id]
+            if check_category and (transaction.category or "").casefold() != folded_category:
+                continue
+            if min_amount is not None and transaction.amount < min_amount:
+                continue
+            if max_amount is not None and transaction.amount > max_amount:
+                continue
+            yield transaction
+
+    def _match_text(self, text: str) -> set[str]:
+        result: set[str] | None = None
+        for token in sorted(set(_TOKEN_RE.findall(text.casefold())), key=len, reverse=True):
+            matches: set[str] = set()
+            index = bisect_left(self._vocabulary, token)
+            while index < len(self._vocabulary) and self._vocabulary[index].startswith(token):
+                matches |= self._tokens[self._vocabulary[index]]
+                index += 1
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        # Eingaben ohne Wortzeichen (z. B. "!!!") passen auf nichts statt auf alles.
+        return result if result is not None else set()
+
+    def _add(self, transaction: IndexedTransaction, *, keep_sorted: bool = True) -> None:
+        add = insort if keep_sorted else list.append
+        self._by_id[transaction.id] = transaction
+        key = (transaction.ordinal, transaction.id)
+        add(self._by_date, key)
+        if transaction.category:
+            add(self._by_category.setdefault(transaction.category.casefold(), []), key)
+        for token in _tokens(transaction):
+            ids = self._tokens.get(token)
+            if ids is None:
+                ids = self._tokens[token] = set()
+                if keep_sorted:
+                    insort(self._vocabulary, token)
+            ids.add(transaction.id)
+
+    def _remove(self, transaction: IndexedTransaction) -> None:
+        del self._by_id[transaction.id]
+        key = (transaction.ordinal, transaction.id)
+        _discard_sorted(self._by_date, key)
+        if transaction.category:
+            folded = transaction.category.casefold()
+            bucket = self._by_category.get(folded)
+            if bucket is not None:
+                _discard_sorted(bucket, key)
+                if not bucket:
+                    del self._by_category[folded]
+        for token in _tokens(transaction):
+            ids = self._tokens.get(token)
+            if ids is None:
+                continue
+            ids.discard(transaction.id)
+            if not ids:
+                del self._tokens[token]
+                _discard_sorted(self._vocabulary, token)
+
+
+def _discard_sorted(sequence: list[Any], value: Any) -> None:
+    index = bisect_left(sequence, value)
+    if index < len(sequence) and sequence[index] == value:
+        del sequence[index]
+
+
+def search_transactions(
+    indexes: Iterable[TransactionIndex],
+    *,
+    page: int,
+    page_size: int,
+    **filters: Any,
+) -> TransactionSearchResult:
+    # Treffer mehrerer Einträge nach Datum zusammenführen; Summen gelten für alle Treffer.
+    merged = heapq.merge(
+        *(index.iter_matches(**filters) for index in indexes),
+        key=lambda transaction: (transaction.ordinal, transaction.id),
+        reverse=True,
+    )
+
+    start = (page - 1) * page_size
+    items: list[IndexedTransaction] = []
+    amounts: list[float] = []
+    for position, transaction in enumerate(merged):
+        amounts.append(transaction.amount)
+        if start <= position < start + page_size:
+            items.append(transaction)
+
+    return TransactionSearchResult(
+        total=len(amounts),
+        sum=round(math.fsum(amounts), 2),
+        income=round(math.fsum(amount for amount in amounts if amount > 0), 2),
+        expenses=round(math.fsum(-amount for amount in amounts if amount < 0), 2),
+        items=items,
+    )